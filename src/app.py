@@ -53,12 +53,27 @@ class ScholarRankApp(App):
         self.push_screen(ChatScreen())
 
 
+def run_app(app: App) -> None:
+    """Run the app on uvloop when it is available.
+
+    uvloop is not available on Windows, where Textual's default loop is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        app.run()
+        return
+    # uvloop.run creates and closes its own loop, so no global event loop policy is
+    # installed (uvloop.install() is deprecated on Python 3.12+)
+    uvloop.run(app.run_async())
+
+
 def main() -> None:
     """Entry point for the application."""
     load_dotenv()
     configure_logging()
     app = ScholarRankApp()
-    app.run()
+    run_app(app)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,9 @@ PROFILE_DRAFT_PATH = DATA_DIR / "profile_draft.yaml"
 DEFAULT_MATCHES_PATH = DATA_DIR / "matches.csv"
 FETCH_ERRORS_LOG_PATH = DATA_DIR / "fetch_errors.log"
 
+# (path, file mtime/size, parsed profile) from the last get_profile_cached() load
+_profile_cache: tuple[Optional[Path], Optional[tuple[int, int]], Optional[UserProfile]] = (None, None, None)
+
 
 def ensure_data_dir() -> None:
     """Ensure the data directory exists."""
@@ -66,9 +69,46 @@ def save_profile(profile: UserProfile, path: Optional[Path] = None) -> Path:
     with open(path, "w", encoding="utf-8") as f:
         yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
+    invalidate_profile_cache()
     return path
 
 
+def get_profile_cached(path: Optional[Path] = None) -> Optional[UserProfile]:
+    """Load the saved profile, reusing the parsed copy until the file changes.
+
+    A single stat() serves as both the existence check and the cache key, so
+    callers don't need a separate profile_exists() call.
+
+    Args:
+        path: Optional path to profile file. Defaults to data/profile.yaml.
+
+    Returns:
+        The cached or freshly loaded UserProfile, or None if no profile has been saved.
+    """
+    global _profile_cache
+
+    if path is None:
+        path = DEFAULT_PROFILE_PATH
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached_path, cached_key, profile = _profile_cache
+    if profile is None or cached_path != path or cached_key != file_key:
+        profile = load_profile(path)
+        _profile_cache = (path, file_key, profile)
+    return profile
+
+
+def invalidate_profile_cache() -> None:
+    """Drop the profile cached by get_profile_cached()."""
+    global _profile_cache
+    _profile_cache = (None, None, None)
+
+
 def profile_exists(path: Optional[Path] = None) -> bool:
     """Check if a profile file exists.
 
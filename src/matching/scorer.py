@@ -293,6 +293,10 @@ class FitScorer:
         if len(match_results) != len(scholarships):
             raise ValueError("match_results and scholarships must have same length")
         
+        # Resolve the default once so every row is scored against the same day
+        if reference_date is None:
+            reference_date = date.today()
+        
         scores = []
         for match, scholarship in zip(match_results, scholarships):
             score = self.calculate(match, scholarship, reference_date)
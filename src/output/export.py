@@ -7,6 +7,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Shared read-only default for missing nested dicts, so lookups don't allocate one per row
+_EMPTY: Dict[str, Any] = {}
+
+# Markdown icon for each requirement match status
+_REQ_ICONS = {"matched": "✓", "partial": "~", "unmatched": "✗"}
+
 
 def _format_amount(cents: Optional[int]) -> str:
     """Format amount in cents to dollar string."""
@@ -25,7 +31,7 @@ def _get_profile_hash(scholarships: List[Dict[str, Any]]) -> str:
     
     # Create a simple hash from the first match result
     first = scholarships[0]
-    match_result = first.get("match_result", {})
+    match_result = first.get("match_result", _EMPTY)
     details = match_result.get("details", [])
     
     # Hash the requirement types to create a profile signature
@@ -50,7 +56,7 @@ def export_json(
     """
     eligible_count = sum(
         1 for s in scholarships
-        if s.get("match_result", {}).get("eligible", False)
+        if s.get("match_result", _EMPTY).get("eligible", False)
     )
     
     export_data = {
@@ -67,9 +73,9 @@ def export_json(
                 "amount_max": s.get("amount_max"),
                 "deadline": s.get("deadline"),
                 "fit_score": s.get("fit_score", 0),
-                "fit_score_breakdown": s.get("fit_score_breakdown", {}),
-                "eligible": s.get("match_result", {}).get("eligible", False),
-                "match_result": s.get("match_result", {}),
+                "fit_score_breakdown": s.get("fit_score_breakdown", _EMPTY),
+                "eligible": s.get("match_result", _EMPTY).get("eligible", False),
+                "match_result": s.get("match_result", _EMPTY),
                 "application_url": s.get("application_url"),
             }
             for i, s in enumerate(
@@ -151,7 +157,7 @@ def export_csv(
                 "amount": amount,
                 "deadline": scholarship.get("deadline", "Open/Rolling"),
                 "fit_score": f"{fit_pct}%",
-                "eligible": "Yes" if scholarship.get("match_result", {}).get("eligible", False) else "No",
+                "eligible": "Yes" if scholarship.get("match_result", _EMPTY).get("eligible", False) else "No",
                 "application_url": scholarship.get("application_url", ""),
             })
 
@@ -188,7 +194,7 @@ def export_markdown(
     lines.append(f"**Total Scholarships:** {len(scholarships)}")
     eligible_count = sum(
         1 for s in scholarships
-        if s.get("match_result", {}).get("eligible", False)
+        if s.get("match_result", _EMPTY).get("eligible", False)
     )
     lines.append(f"**Eligible:** {eligible_count}")
     lines.append("")
@@ -205,7 +211,7 @@ def export_markdown(
         source = scholarship.get("source", "Unknown")
         fit_score = scholarship.get("fit_score", 0)
         fit_pct = int(fit_score * 100)
-        eligible = scholarship.get("match_result", {}).get("eligible", False)
+        eligible = scholarship.get("match_result", _EMPTY).get("eligible", False)
         
         lines.append(f"**Source:** {source}")
         lines.append(f"**Fit Score:** {fit_pct}%")
@@ -243,7 +249,7 @@ def export_markdown(
             lines.append("")
         
         # Match details
-        match_result = scholarship.get("match_result", {})
+        match_result = scholarship.get("match_result", _EMPTY)
         if match_result:
             lines.append("### Requirements")
             lines.append("")
@@ -255,15 +261,7 @@ def export_markdown(
                     status = detail.get("status", "unknown")
                     user_val = detail.get("user_value", "")
                     
-                    if status == "matched":
-                        icon = "✓"
-                    elif status == "partial":
-                        icon = "~"
-                    elif status == "unmatched":
-                        icon = "✗"
-                    else:
-                        icon = "?"
-                    
+                    icon = _REQ_ICONS.get(status, "?")
                     lines.append(f"- {icon} {req}")
                     if user_val and user_val != "Not specified":
                         lines.append(f"  - Your value: {user_val}")
@@ -27,6 +27,7 @@ class BaseScraper(ABC):
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
         self._last_request_time: float = 0.0
+        self._client: httpx.AsyncClient | None = None
 
     @property
     @abstractmethod
@@ -48,6 +49,26 @@ class BaseScraper(ABC):
         """
         pass
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the scraper's HTTP client, creating it on first use.
+
+        The client is kept between requests and scrapes so connections are reused.
+        """
+        if self._client is None or self._client.is_closed:
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+            }
+            self._client = httpx.AsyncClient(timeout=10.0, headers=headers, follow_redirects=True)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def fetch(self, url: str) -> str | None:
         """Fetch content from a URL with rate limiting and retry logic.
         
@@ -65,17 +86,12 @@ class BaseScraper(ABC):
                 # Apply rate limiting
                 await self._apply_rate_limit()
 
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                }
-                async with httpx.AsyncClient(timeout=10.0, headers=headers, follow_redirects=True) as client:
-                    logger.debug(f"[{self.name}] Fetching: {url} (attempt {attempt + 1}/{self.max_retries})")
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    logger.debug(f"[{self.name}] Successfully fetched: {url}")
-                    return response.text
+                client = self._get_client()
+                logger.debug(f"[{self.name}] Fetching: {url} (attempt {attempt + 1}/{self.max_retries})")
+                response = await client.get(url)
+                response.raise_for_status()
+                logger.debug(f"[{self.name}] Successfully fetched: {url}")
+                return response.text
 
             except httpx.HTTPStatusError as e:
                 logger.warning(
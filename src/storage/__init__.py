@@ -1,6 +1,6 @@
 """Storage module for SQLite database operations."""
 
-from src.storage.database import init_db, get_session, get_engine
-from src.storage.models import Scholarship, FetchLog
+from src.storage.database import init_db, get_session, get_engine, session_scope
+from src.storage.models import Scholarship, FetchLog, ScholarshipRow
 
-__all__ = ["init_db", "get_session", "get_engine", "Scholarship", "FetchLog"]
+__all__ = ["init_db", "get_session", "get_engine", "session_scope", "Scholarship", "FetchLog", "ScholarshipRow"]
@@ -1,9 +1,10 @@
 """Database connection management and initialization."""
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -18,6 +19,18 @@ _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune each new SQLite connection for the app's write pattern.
+
+    WAL lets /match and /stats read while a fetch is writing, and with WAL
+    synchronous=NORMAL only syncs at checkpoints instead of on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 def get_engine(db_path: Path | None = None) -> Engine:
     """Get or create the SQLAlchemy engine.
 
@@ -41,12 +54,17 @@ def get_engine(db_path: Path | None = None) -> Engine:
             echo=False,
             connect_args={"check_same_thread": False},
         )
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
 
     return _engine
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Get a database session.
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Provide a session for one unit of work.
+
+    Commits when the block exits normally, rolls back on error, and always closes
+    the session.
 
     Yields:
         SQLAlchemy Session instance.
@@ -67,6 +85,16 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_session() -> Generator[Session, None, None]:
+    """Get a database session.
+
+    Yields:
+        SQLAlchemy Session instance.
+    """
+    with session_scope() as session:
+        yield session
+
+
 def init_db(db_path: Path | None = None) -> None:
     """Initialize the database by creating all tables.
 
@@ -75,3 +103,9 @@ def init_db(db_path: Path | None = None) -> None:
     """
     engine = get_engine(db_path)
     Base.metadata.create_all(engine)
+
+    # create_all skips tables that already exist, so add any indexes introduced
+    # after an existing database was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
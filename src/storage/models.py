@@ -1,12 +1,13 @@
 """SQLAlchemy models for ScholarRank database."""
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, NamedTuple, Optional
 
 from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Index,
     Integer,
     JSON,
     String,
@@ -65,13 +66,43 @@ class FetchLog(Base):
     __tablename__ = "fetch_log"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    source: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
     fetched_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, nullable=False, index=True
     )
     scholarships_found: Mapped[Optional[int]] = mapped_column(Integer)
     scholarships_new: Mapped[Optional[int]] = mapped_column(Integer)
     errors: Mapped[Optional[str]] = mapped_column(Text)
 
+    # Serves per-source "latest fetch" lookups; also covers plain source filters
+    __table_args__ = (
+        Index("ix_fetch_log_source_fetched_at", "source", "fetched_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<FetchLog(id={self.id}, source={self.source!r}, fetched_at={self.fetched_at})>"
+
+
+class ScholarshipRow(NamedTuple):
+    """Read-only snapshot of the Scholarship columns used for matching, scoring and display.
+
+    Large text columns (description, raw_eligibility) are deliberately left out.
+
+    A compact alternative to a per-row dict. ``get`` mirrors ``dict.get`` so rows can be
+    passed to code written against scholarship dicts.
+    """
+
+    id: str
+    title: str
+    source: str
+    amount_min: Optional[int]
+    amount_max: Optional[int]
+    deadline: Optional[date]
+    application_url: Optional[str]
+    parsed_eligibility: dict
+    effort_score: Optional[int]
+    competition_score: Optional[int]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the named field, or default if the row has no such field."""
+        return getattr(self, key, default)
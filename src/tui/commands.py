@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Callable
 
+from textual.content import Content
+
 
 class CommandType(Enum):
     """Types of slash commands."""
@@ -83,6 +85,11 @@ class CommandParser:
   [bold #a0a0a0]Enter[/bold #a0a0a0]              View selected item
   """
 
+    # Stripped once here rather than on every /help
+    _HELP_TEXT_STRIPPED = HELP_TEXT.strip()
+    # Parsed on first use and shared by every /help
+    _help_content: Content | None = None
+
     def parse(self, input_text: str) -> CommandResult:
         """Parse a command string.
 
@@ -130,4 +137,10 @@ class CommandParser:
 
     def get_help_text(self) -> str:
         """Get the help text for all commands."""
-        return self.HELP_TEXT.strip()
+        return self._HELP_TEXT_STRIPPED
+
+    def get_help_content(self) -> Content:
+        """Get the help text as pre-parsed Textual content, parsing its markup only once."""
+        if CommandParser._help_content is None:
+            CommandParser._help_content = Content.from_markup(self._HELP_TEXT_STRIPPED)
+        return CommandParser._help_content
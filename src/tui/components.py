@@ -1,6 +1,7 @@
 """Minimal TUI components for ScholarRank."""
 
 from typing import Optional
+from textual.content import Content
 from textual.containers import VerticalScroll
 from textual.widgets import Static, OptionList
 from textual.widgets.option_list import Option
@@ -30,6 +31,13 @@ class FetchProgress(Static):
         "Processing eligibility data...",
         "Finalizing results...",
     ]
+
+    # Status marks are the same on every repaint, so they are built once.  Text.assemble
+    # copies its parts, so sharing these instances is safe.
+    _MARK_FAILED = Text("✗ ", style="bold #ef4444")
+    _MARK_DONE = Text("✓ ", style="bold #10b981")
+    _MARK_WAITING = Text("○ ", style="dim #404040")
+    _MARK_SPINNER = tuple(Text(f"{frame} ", style="bold #d4af37") for frame in SPINNER)
     
     current_source: reactive[int] = reactive(-1)
     spinner_frame: reactive[int] = reactive(0)
@@ -59,24 +67,26 @@ class FetchProgress(Static):
             if i in self.source_results:
                 result = self.source_results[i]
                 if "error" in result:
-                    mark = Text("✗ ", style="bold #ef4444")
+                    mark = self._MARK_FAILED
                     name = Text(f"{source}", style="#ef4444")
                 else:
-                    mark = Text("✓ ", style="bold #10b981")
+                    mark = self._MARK_DONE
                     name = Text(f"{source}", style="#10b981")
                     count = Text(f" ({result.get('count', 0)})", style="dim #717682")
                     lines.append(Text.assemble("  ", mark, name, count))
                     continue
-            elif i == self.current_source:
-                mark = Text(f"{self.SPINNER[self.spinner_frame]} ", style="bold #d4af37")
+            elif i <= self.current_source:
+                # Sources run concurrently, so every started source is in flight
+                mark = self._MARK_SPINNER[self.spinner_frame]
                 name = Text(f"{source}", style="bold #d4af37")
             else:
-                mark = Text("○ ", style="dim #404040")
+                mark = self._MARK_WAITING
                 name = Text(f"{source}", style="dim #505050")
             lines.append(Text.assemble("  ", mark, name))
         
         # Status message
-        status_idx = max(0, min(self.current_source, len(self.STATUS_MESSAGES) - 1))
+        done = len(self.source_results)
+        status_idx = min(done, len(self.STATUS_MESSAGES) - 1)
         status = self.STATUS_MESSAGES[status_idx] if self.current_source >= 0 else "Preparing..."
         
         header = Text.assemble(
@@ -87,7 +97,7 @@ class FetchProgress(Static):
         )
         
         # Progress bar
-        progress = (self.current_source + 1) / len(self.SOURCES) if self.current_source >= 0 else 0
+        progress = done / len(self.SOURCES)
         bar_width = 30
         filled = int(bar_width * progress)
         bar = Text.assemble(
@@ -120,11 +130,11 @@ class FetchProgress(Static):
             if i in self.source_results:
                 result = self.source_results[i]
                 if "error" in result:
-                    mark = Text("✗ ", style="bold #ef4444")
+                    mark = self._MARK_FAILED
                     name = Text(f"{source}", style="#ef4444 dim")
                     info = Text(" failed", style="dim #ef4444")
                 else:
-                    mark = Text("✓ ", style="bold #10b981")
+                    mark = self._MARK_DONE
                     name = Text(f"{source}", style="#a0a0a0")
                     info = Text(f" ({result.get('count', 0)})", style="dim #717682")
                 lines.append(Text.assemble("  ", mark, name, info))
@@ -151,8 +161,8 @@ class FetchProgress(Static):
         )
     
     def start_source(self, index: int) -> None:
-        """Mark a source as in-progress."""
-        self.current_source = index
+        """Mark a source (and every source before it) as in-progress."""
+        self.current_source = max(self.current_source, index)
         self.mutate_reactive(FetchProgress.source_results)
     
     def complete_source(self, index: int, count: int) -> None:
@@ -177,23 +187,29 @@ class FetchProgress(Static):
 class ChatLog(VerticalScroll):
     """Scrollable chat log with helper write methods."""
 
-    def write(self, text: str) -> None:
-        """Append a generic message (system/log)."""
-        widget = Static(text, markup=True, classes="message")
+    # Oldest entries are removed past this many, so a long session can't grow without bound
+    MAX_MESSAGES = 500
+
+    def _append(self, widget: Static) -> None:
+        """Mount a new entry at the bottom, trimming the oldest entries over the cap."""
         self.mount(widget)
         self.call_after_refresh(widget.scroll_visible)
+        excess = len(self.children) - self.MAX_MESSAGES
+        if excess > 0:
+            self.remove_children(self.children[:excess])
+
+    def write(self, text: str | Content) -> None:
+        """Append a generic message (system/log)."""
+        self._append(Static(text, markup=True, classes="message"))
 
     def add_bubble(self, text: str, is_user: bool) -> None:
         """Add a chat bubble."""
-        bubble = ChatBubble(text, is_user=is_user)
-        self.mount(bubble)
-        self.call_after_refresh(bubble.scroll_visible)
+        self._append(ChatBubble(text, is_user=is_user))
 
     def start_stream(self, is_user: bool = False) -> ChatBubble:
         """Create a streaming bubble and return it."""
         bubble = ChatBubble("", is_user=is_user)
-        self.mount(bubble)
-        self.call_after_refresh(bubble.scroll_visible)
+        self._append(bubble)
         return bubble
 
 
@@ -1,21 +1,41 @@
 """Simple chat-based TUI screen for ScholarRank."""
 
 import asyncio
+import bisect
+import csv
+import hashlib
+import heapq
+import io
 import logging
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
+import orjson
+from rich.markup import escape as markup_escape
+from sqlalchemy import bindparam, delete, func, insert, literal, null, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Input, Static, ProgressBar
 from textual.containers import Vertical, Container
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from textual.worker import Worker, WorkerState
 
-from src.tui.commands import CommandParser, CommandType
-from src.config import load_profile, save_profile, profile_exists, INTERVIEW_DRAFT_PATH, DEFAULT_MATCHES_PATH, ensure_data_dir
+from src.tui.commands import CommandParser, CommandResult, CommandType
+from src.matching.matcher import EligibilityMatcher, MatchResult
+from src.matching.scorer import FitScore, FitScorer
+from src.storage.database import session_scope
+from src.storage.models import Scholarship, FetchLog, ScholarshipRow
+from src.config import get_profile_cached, save_profile, INTERVIEW_DRAFT_PATH, DEFAULT_MATCHES_PATH, ensure_data_dir
 from src.tui.components import ChatLog, FetchProgress, CommandSuggestionList
 from textual import events
 
@@ -79,7 +99,399 @@ WELCOME_ART = r"""
 /____/\___/_/ /_/\____/\__,_/_/  /_/ |_|\__,_/_/ /_/_/|_|
 """
 
+# Seconds between bubble redraws while an interview response is streaming
+STREAM_FLUSH_INTERVAL = 0.04
+
+# Number of /match results written to the log per chunk
+MATCH_RENDER_CHUNK = 20
+
+# Fit-score colour tiers for /match: Ruby Red below 60%, Amber from 60%, Emerald from 80%
+_FIT_THRESHOLDS = (60, 80)
+_FIT_STYLES = ("#ef4444", "#f59e0b", "#10b981")
+
+# Everything but digits, stripped from scraped amounts like "$5,000"
+_NON_DIGITS_RE = re.compile(r"\D")
+
+# Marks a cached value that has not been read yet (None is a valid cached value)
+_UNSET = object()
+
+# The parser is stateless, so every screen shares one, along with its parse cache
+_COMMAND_PARSER = CommandParser()
+_parse_cached = lru_cache(maxsize=64)(_COMMAND_PARSER.parse)
+_COMMAND_NAMES = list(CommandParser.COMMANDS)
+
+# Percent-encode characters that would break out of a [link="..."] markup tag
+_URL_MARKUP_TR = str.maketrans({'"': "%22", "[": "%5B", "]": "%5D"})
+
+# The OPENAI_API_KEY line in .env, including its line ending
+_ENV_API_KEY_RE = re.compile(rb"(?m)^OPENAI_API_KEY=.*(?:\r?\n|$)")
+
+
+_DOLLARS = "${:,}".format
+_DOLLARS_PLUS = "${:,}+".format
+_DOLLARS_K = "${}k".format
+
+
+def _parse_command(text: str) -> CommandResult:
+    """Parse a command, reusing cached results for repeated input.
+
+    Parsing is a pure function of the input text and users repeat commands often.
+    Each caller gets its own copy of args, so a handler changing them can't affect
+    later parses.  /apikey input is never cached, to keep the key out of memory.
+    """
+    parts = text.split(maxsplit=1)
+    if parts and parts[0].lower() == "/apikey":
+        return _COMMAND_PARSER.parse(text)
+    result = _parse_cached(text)
+    return replace(result, args=result.args.copy())
+
+
+def _write_matches(filename: str, fmt: str, eligible: list[dict]) -> None:
+    """Write sorted match rows to filename as json, csv or markdown.
+
+    Blocking file I/O, so commands run it in a worker thread.
+    """
+    if fmt == "json":
+        # Serialized in one C pass as UTF-8; dates come out as ISO strings
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(eligible, option=orjson.OPT_INDENT_2, default=str))
+    elif fmt == "csv":
+        with open(filename, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(("title", "fit_score", "amount", "deadline", "source", "application_url"))
+
+            def csv_amount(s: dict) -> str:
+                if s["amount_max"]:
+                    return f"${s['amount_max'] // 100:,}"
+                if s["amount_min"]:
+                    return f"${s['amount_min'] // 100:,}+"
+                return "Varies"
+
+            writer.writerows(
+                (
+                    s["title"],
+                    f"{int(s['fit_score'] * 100)}%",
+                    csv_amount(s),
+                    s["deadline"] or "Open",
+                    s["source"],
+                    s["application_url"] or "",
+                )
+                for s in eligible
+            )
+    elif fmt == "markdown":
+        with open(filename, "w") as f:
+            f.write("# Scholarship Matches\n\n")
+            for i, s in enumerate(eligible, 1):
+                f.write(f"## {i}. {s['title']}\n\n")
+                f.write(f"- **Fit Score:** {int(s['fit_score'] * 100)}%\n")
+                f.write(f"- **Source:** {s['source']}\n")
+                f.write(f"- **Deadline:** {s['deadline'] or 'Open'}\n")
+                if s["application_url"]:
+                    f.write(f"- **Apply:** {s['application_url']}\n")
+                f.write("\n")
+
+
+@lru_cache(maxsize=512)
+def _format_amount(amount_min: Optional[int], amount_max: Optional[int]) -> str:
+    """Format amount (in cents) for display.
+
+    Many scholarships share the same amounts, so results are cached.
+    """
+    if amount_max:
+        # $10,000 and up is shown in thousands
+        if amount_max >= 1_000_000:
+            return _DOLLARS_K(amount_max // 100_000)
+        return _DOLLARS(amount_max // 100)
+    elif amount_min:
+        return _DOLLARS_PLUS(amount_min // 100)
+    return "Varies"
+
+
+# Scraper classes and the interviewer pull in heavy dependencies (httpx, OpenAI),
+# so they are imported on first use and kept for later commands
+_scrapers: list[tuple[str, type["BaseScraper"]]] | None = None
+_interviewer_class: type["ProfileInterviewer"] | None = None
+
+
+def _get_scrapers() -> list[tuple[str, type["BaseScraper"]]]:
+    """Get (display name, scraper class) for every source, importing them on first use."""
+    global _scrapers
+
+    if _scrapers is None:
+        from src.scrapers import (
+            FastwebScraper,
+            ScholarshipsComScraper,
+            CareerOneStopScraper,
+            IEFAScraper,
+            Scholars4devScraper,
+        )
+
+        _scrapers = [
+            ("Fastweb", FastwebScraper),
+            ("Scholarships.com", ScholarshipsComScraper),
+            ("CareerOneStop", CareerOneStopScraper),
+            ("IEFA", IEFAScraper),
+            ("Scholars4dev", Scholars4devScraper),
+        ]
+
+    return _scrapers
+
+
+def _get_interviewer_class() -> type["ProfileInterviewer"]:
+    """Get the ProfileInterviewer class, importing it on first use."""
+    global _interviewer_class
+
+    if _interviewer_class is None:
+        from src.profile.interview import ProfileInterviewer
+
+        _interviewer_class = ProfileInterviewer
+
+    return _interviewer_class
+
+
+def _parse_amount_cents(amount) -> int:
+    """Convert a scraped amount (int, float, or text like "$5,000") to cents.
+
+    Values under 10000 are taken to be dollars; anything unparseable is 0.
+    """
+    if isinstance(amount, str):
+        amount = int(_NON_DIGITS_RE.sub("", amount) or "0")
+    elif not isinstance(amount, (int, float)):
+        return 0
+    return amount * 100 if amount < 10000 else amount
+
+
+def _prepare_rows(source_key: str, scholarships: list[dict], dateparser) -> dict[str, dict]:
+    """Turn one scraper's results into Scholarship insert rows keyed by id.
+
+    A listing repeated within the batch keeps its first copy.  dateparser is
+    dateutil's parser module, or None to leave deadlines unset.
+    """
+    prefix = source_key + ":"
+    sha256 = hashlib.sha256
+    rows = {}
+    for s in scholarships:
+        get = s.get
+        # Unique ID from source + url or title
+        scholarship_id = sha256((prefix + (get("url") or get("title", ""))).encode()).hexdigest()[:64]
+        if scholarship_id in rows:
+            continue
+
+        amount_cents = _parse_amount_cents(get("amount"))
+
+        # Parse deadline
+        deadline_val = None
+        if dateparser and get("deadline"):
+            try:
+                deadline_val = dateparser.parse(str(s["deadline"])).date()
+            except Exception:
+                pass
+
+        # Convert requirements list to string
+        raw_elig = get("requirements", [])
+        if isinstance(raw_elig, list):
+            raw_elig = "\n".join(str(r) for r in raw_elig)
+
+        rows[scholarship_id] = {
+            "id": scholarship_id,
+            "source": source_key,
+            "source_id": get("source_id"),
+            "title": get("title", "")[:500],
+            "description": get("description"),
+            "amount_min": amount_cents,
+            "amount_max": amount_cents,
+            "deadline": deadline_val,
+            "application_url": get("url"),
+            "raw_eligibility": raw_elig or None,
+        }
+    return rows
+
+
+def _save_fetch_results(
+    prepared: list[tuple[int, str, str, int, dict[str, dict]]],
+    fetch_logs: list[dict],
+    now: datetime,
+) -> tuple[int, int, list[tuple[int, str, str]]]:
+    """Write one /fetch run's scholarships and fetch logs in a single transaction.
+
+    Each source gets a savepoint, so a batch that fails to save is rolled back
+    alone and reported in the returned failures as (index, name, error).
+    Returns (rows inserted, scholarships in the table, failures).  Blocking
+    database I/O, so the fetch worker runs it in a worker thread.
+    """
+    # Rows inserted by saved sources, so no before/after COUNT(*) is needed
+    total_new = 0
+    failures = []
+    # New rows are stamped with this created_at, so RETURNING tells them apart
+    # from rows the upsert only touched
+    stamp = datetime.utcnow()
+    stmt = sqlite_insert(Scholarship)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Scholarship.id],
+        set_={"last_seen_at": now, "updated_at": stamp},
+    ).returning(Scholarship.created_at)
+    with session_scope() as session:
+        for i, name, source_key, count, rows in prepared:
+            new_count = 0
+            try:
+                with session.begin_nested():
+                    # One upsert inserts new rows and refreshes last_seen_at on rows
+                    # already stored; insertmanyvalues pages it into multi-row
+                    # statements under SQLite's bound-parameter limit.
+                    if rows:
+                        for row in rows.values():
+                            row["created_at"] = stamp
+                        created = session.scalars(stmt, list(rows.values()))
+                        new_count = sum(1 for c in created if c == stamp)
+            except Exception as e:
+                logger.error(f"Fetch error for {name}: {e}")
+                fetch_logs.append({
+                    "source": source_key,
+                    "fetched_at": now,
+                    "scholarships_found": count,
+                    "scholarships_new": 0,
+                    "errors": str(e),
+                })
+                failures.append((i, name, str(e)))
+                continue
+
+            total_new += new_count
+            fetch_logs.append({
+                "source": source_key,
+                "fetched_at": now,
+                "scholarships_found": count,
+                "scholarships_new": new_count,
+                "errors": None,
+            })
+
+        # A failure to record the fetch history must not undo the saved scholarships
+        try:
+            with session.begin_nested():
+                if fetch_logs:
+                    session.execute(insert(FetchLog), fetch_logs)
+        except Exception as log_error:
+            logger.error(f"Failed to record fetch logs: {log_error}")
+
+        after_count = session.query(func.count(Scholarship.id)).scalar() or 0
+
+    return total_new, after_count, failures
+
+
+def _match_and_score(
+    matcher: EligibilityMatcher,
+    scorer: FitScorer,
+    profile: "UserProfile",
+    scholarships_data: list[ScholarshipRow],
+) -> tuple[list[int], list[MatchResult], list[FitScore]]:
+    """Run eligibility matching, then fit-score the eligible scholarships.
+
+    This is pure CPU work, so commands run it in a worker thread to keep the UI responsive.
+
+    Returns:
+        Tuple of (indices of eligible rows, their match results, their fit scores).
+    """
+    match = matcher.match
+    calculate = scorer.calculate
+    today = date.today()
+    eligible_idx = []
+    eligible_matches = []
+    fit_scores = []
+    # One pass: each row is matched and, only if eligible, scored while it is at hand
+    for i, row in enumerate(scholarships_data):
+        result = match(profile, row.parsed_eligibility, row.id)
+        if result.eligible:
+            eligible_idx.append(i)
+            eligible_matches.append(result)
+            fit_scores.append(calculate(result, row, today))
+
+    logger.info(f"Matched {len(scholarships_data)} scholarships, {len(eligible_idx)} eligible")
+    return eligible_idx, eligible_matches, fit_scores
+
+
+@lru_cache(maxsize=4096)
+def _render_row(
+    scholarship_id: str,
+    title: str,
+    amount_min: Optional[int],
+    amount_max: Optional[int],
+    deadline: Optional[date],
+    url: Optional[str],
+) -> tuple[str, str, str, str, str]:
+    """Build the display fields for a /match row.
+
+    These only depend on the scholarship itself, so repeated /match calls reuse them.
+
+    Returns:
+        Tuple of (escaped title, amount, deadline, link-safe URL, escaped display URL).
+    """
+    escaped_title = markup_escape(title[:50])
+    amount = _format_amount(amount_min, amount_max)
+    deadline_str = deadline.isoformat() if deadline else "Open"
+    if not url:
+        return escaped_title, amount, deadline_str, "", ""
+
+    safe_url = url.translate(_URL_MARKUP_TR)
+    # Truncate long URLs for display
+    display_url = url if len(url) <= 50 else url[:47] + "..."
+    # Only "[" and "\\" are special to markup, so most URLs need no escaping
+    if "[" in display_url or "\\" in display_url:
+        display_url = markup_escape(display_url)
+    return escaped_title, amount, deadline_str, safe_url, display_url
+
+# /stats statements are built once so SQLAlchemy's compiled cache is hit on every call.
+# They target the Core tables since only plain counts come back, no ORM entities.
+_scholarships_t = Scholarship.__table__
+_fetch_logs_t = FetchLog.__table__
+# Both figures come back from one UNION ALL round-trip, tagged by the "kind" column:
+# kind 0 is the 24h fetch count, kind 1 rows are the per-source counts.
+_STMT_STATS = (
+    select(literal(0).label("kind"), null().label("source"), func.count().label("n"))
+    .select_from(_fetch_logs_t)
+    .where(_fetch_logs_t.c.fetched_at > bindparam("since"))
+    .union_all(
+        select(literal(1), _scholarships_t.c.source, func.count())
+        .group_by(_scholarships_t.c.source)
+    )
+    .order_by("kind", "source")
+)
+
+
+def _collect_stats() -> dict:
+    """Gather /stats figures in a session of its own (safe to run in a worker thread)."""
+    # Recent (last 24h) fetches are answered from the fetched_at index
+    yesterday = datetime.now() - timedelta(days=1)
+    with session_scope() as session:
+        rows = session.execute(_STMT_STATS, {"since": yesterday}).all()
+
+    recent = 0
+    by_source = []
+    for kind, source, count in rows:
+        if kind == 0:
+            recent = count
+        else:
+            by_source.append((source, count))
+
+    return {
+        # The grand total is the sum of the per-source counts, so no separate COUNT(*) scan
+        "total": sum(count for _, count in by_source),
+        "recent": recent,
+        "by_source": by_source,
+    }
+
+
+def _delete_expired() -> int:
+    """Delete scholarships whose deadline has passed and return how many were removed."""
+    expired = _scholarships_t.c.deadline < date.today()
+    with session_scope() as session:
+        # Probe for one expired row first so the common "nothing to clean" case stays read-only
+        if session.execute(select(_scholarships_t.c.id).where(expired).limit(1)).first() is None:
+            return 0
+        # Single DELETE statement instead of loading and deleting row by row
+        return session.execute(delete(_scholarships_t).where(expired)).rowcount
+
+
 if TYPE_CHECKING:
+    from src.scrapers.base import BaseScraper
     from src.profile.interview import ProfileInterviewer
     from src.profile.models import UserProfile
 
@@ -97,25 +509,61 @@ class ChatScreen(Screen):
 
     def __init__(self) -> None:
         super().__init__()
-        self.command_parser = CommandParser()
+        self.command_parser = _COMMAND_PARSER
+        self._parse_command = _parse_command
         self.interviewer: Optional["ProfileInterviewer"] = None
         self._in_interview = False
         self._stream_bubble: Optional[Static] = None
         self._stream_text: str = ""
+        self._stream_flush_timer: Optional[Timer] = None
+        # Interview answers typed while a reply is still streaming, sent together next
+        self._pending_interview_input: list[str] = []
         self._fetch_progress: Optional[FetchProgress] = None
+        self._scraper_instances: Optional[list[tuple[str, "BaseScraper"]]] = None
+        # Interview progress state; _max_turns is read once per interviewer
+        self._max_turns = 10
+        self._last_progress = -1
+        self._matcher: Optional[EligibilityMatcher] = None
+        self._scorer: Optional[FitScorer] = None
+        # (profile it was rendered from, rendered /profile text)
+        self._profile_view_cache: tuple[Optional["UserProfile"], Optional[str]] = (None, None)
+        # (fingerprint, scholarship rows) reused until the table changes
+        self._data_cache: tuple[Optional[tuple], Optional[list[ScholarshipRow]]] = (None, None)
+        # OPENAI_API_KEY as last read or set by /apikey
+        self._api_key = _UNSET
+
+    @property
+    def matcher(self) -> EligibilityMatcher:
+        """Eligibility matcher shared by every command on this screen."""
+        if self._matcher is None:
+            self._matcher = EligibilityMatcher()
+        return self._matcher
+
+    @property
+    def scorer(self) -> FitScorer:
+        """Fit scorer shared by every command on this screen."""
+        if self._scorer is None:
+            self._scorer = FitScorer()
+        return self._scorer
 
     def compose(self) -> ComposeResult:
+        # Keep references to the widgets used on hot paths instead of querying the DOM each time
+        self._progress_bar = ProgressBar(total=100, show_eta=False, id="interview-progress")
+        self._chat_log = ChatLog(id="chat-log")
+        self._command_list = CommandSuggestionList(id="command-list")
+        self._input = Input(placeholder="Type a command (/help) or message...", id="input")
+
         yield Static("S C H O L A R R A N K", id="header")
-        yield ProgressBar(total=100, show_eta=False, id="interview-progress")
-        yield ChatLog(id="chat-log")
+        yield self._progress_bar
+        yield self._chat_log
         with Vertical(id="input-container"):
-            yield CommandSuggestionList(id="command-list")
-            yield Input(placeholder="Type a command (/help) or message...", id="input")
+            yield self._command_list
+            yield self._input
             yield Static("Ctrl+Q Quit • /init Start Interview • /help Commands", id="tips")
 
     async def on_mount(self) -> None:
         """Show welcome message on mount."""
-        log = self.query_one("#chat-log", ChatLog)
+        log = self._chat_log
         
         # Build the welcome screen components
         steps = """
@@ -138,11 +586,16 @@ class ChatScreen(Screen):
         await log.mount(welcome)
         
         # Focus the input
-        self.query_one("#input", Input).focus()
+        self._input.focus()
+
+    async def on_unmount(self) -> None:
+        """Close the cached scrapers' HTTP clients."""
+        for _, scraper in self._scraper_instances or ():
+            await scraper.close()
 
     def action_focus_input(self) -> None:
         """Focus the input field."""
-        self.query_one("#input", Input).focus()
+        self._input.focus()
 
     def action_quit(self) -> None:
         """Quit the application."""
@@ -156,6 +609,10 @@ class ChatScreen(Screen):
         """Write an AI message as a bubble."""
         log.add_bubble(text, is_user=False)
 
+    def _write_block(self, log: ChatLog, lines: list[str]) -> None:
+        """Write several lines as a single log entry (one mount/render)."""
+        log.write("\n".join(lines))
+
     def _begin_ai_stream(self, log: ChatLog) -> Static:
         """Start an AI streaming response."""
         return log.start_stream(is_user=False)
@@ -164,12 +621,10 @@ class ChatScreen(Screen):
         """Handle input text changes."""
         text = event.value
         try:
-            cmd_list = self.query_one("#command-list", CommandSuggestionList)
+            cmd_list = self._command_list
             
             if text.startswith("/"):
-                # Get commands
-                commands = list(self.command_parser.COMMANDS.keys())
-                cmd_list.update_commands(text.lower(), commands)
+                cmd_list.update_commands(text.lower(), _COMMAND_NAMES)
             else:
                 cmd_list.remove_class("visible")
         except Exception:
@@ -178,7 +633,7 @@ class ChatScreen(Screen):
     async def on_key(self, event: events.Key) -> None:
         """Handle global key events for suggestion navigation."""
         try:
-            cmd_list = self.query_one("#command-list", CommandSuggestionList)
+            cmd_list = self._command_list
             if cmd_list.has_class("visible"):
                 if event.key == "up":
                     cmd_list.action_cursor_up()
@@ -193,7 +648,7 @@ class ChatScreen(Screen):
                     if cmd_list.highlighted is not None:
                         opt = cmd_list.get_option_at_index(cmd_list.highlighted)
                         if opt:
-                            input_widget = self.query_one("#input", Input)
+                            input_widget = self._input
                             input_widget.value = str(opt.prompt) + " "
                             input_widget.action_end() # Move cursor to end
                             cmd_list.remove_class("visible")
@@ -208,12 +663,7 @@ class ChatScreen(Screen):
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle input submission."""
-        try:
-            cmd_list = self.query_one("#command-list", CommandSuggestionList)
-            if cmd_list.has_class("visible"):
-                cmd_list.remove_class("visible")
-        except Exception:
-            pass
+        self._command_list.remove_class("visible")
 
         text = event.value.strip()
         if not text:
@@ -222,7 +672,7 @@ class ChatScreen(Screen):
         # Clear input
         event.input.value = ""
 
-        log = self.query_one("#chat-log", ChatLog)
+        log = self._chat_log
 
         # Show user input with formatting
         self._write_user_message(log, text)
@@ -241,45 +691,25 @@ class ChatScreen(Screen):
 
     async def _handle_command(self, text: str, log: ChatLog) -> None:
         """Handle slash commands."""
-        result = self.command_parser.parse(text)
+        result = self._parse_command(text)
 
         if not result.is_valid:
             log.write(f"[#ef4444]{result.error}[/#ef4444]")
             return
 
-        match result.command_type:
-            case CommandType.HELP:
-                await self._cmd_help(log)
-            case CommandType.QUIT:
-                self.app.exit()
-            case CommandType.INIT:
-                await self._cmd_init(log, result.args)
-            case CommandType.RESUME:
-                await self._cmd_resume(log, result.args)
-            case CommandType.PROFILE:
-                await self._cmd_profile(log)
-            case CommandType.FETCH:
-                await self._cmd_fetch(log, result.args)
-            case CommandType.SOURCES:
-                await self._cmd_sources(log)
-            case CommandType.MATCH:
-                await self._cmd_match(log, result.args)
-            case CommandType.INFO:
-                await self._cmd_info(log, result.args)
-            case CommandType.SAVE:
-                await self._cmd_save(log, result.args)
-            case CommandType.STATS:
-                await self._cmd_stats(log)
-            case CommandType.CLEAN:
-                await self._cmd_clean(log)
-            case CommandType.APIKEY:
-                await self._cmd_apikey(log, result.args)
-            case _:
-                log.write(f"[#ef4444]Unknown command. Type /help for available commands.[/#ef4444]")
-
-    async def _cmd_help(self, log: ChatLog) -> None:
+        handler = self._COMMAND_HANDLERS.get(result.command_type)
+        if handler is None:
+            log.write(f"[#ef4444]Unknown command. Type /help for available commands.[/#ef4444]")
+            return
+        await handler(self, log, result.args)
+
+    async def _cmd_quit(self, log: ChatLog, args: list[str] | None = None) -> None:
+        """Exit the application."""
+        self.app.exit()
+
+    async def _cmd_help(self, log: ChatLog, args: list[str] | None = None) -> None:
         """Show help message."""
-        log.write(self.command_parser.get_help_text())
+        log.write(self.command_parser.get_help_content())
 
     async def _cmd_init(self, log: ChatLog, args: list[str] | None = None) -> None:
         """Start profile interview."""
@@ -296,7 +726,7 @@ class ChatScreen(Screen):
             log.write("[dim]Starting new interview...[/dim]")
 
         try:
-            from src.profile.interview import ProfileInterviewer
+            interviewer_class = _get_interviewer_class()
 
             # Check for existing interview draft
             draft_exists = INTERVIEW_DRAFT_PATH.exists()
@@ -305,18 +735,19 @@ class ChatScreen(Screen):
                 log.write("[#f59e0b]Found an incomplete interview draft.[/#f59e0b]\n[dim]Type /resume to continue or /init --new to start over.[/dim]")
                 return
 
-            self.interviewer = ProfileInterviewer(draft_path=str(INTERVIEW_DRAFT_PATH))
+            self.interviewer = interviewer_class(draft_path=str(INTERVIEW_DRAFT_PATH))
+            self._max_turns = getattr(self.interviewer, 'max_turns', 10)
             self._in_interview = True
 
             # Show and reset progress bar
-            progress_bar = self.query_one("#interview-progress", ProgressBar)
-            progress_bar.add_class("visible")
-            progress_bar.update(progress=0)
+            self._progress_bar.add_class("visible")
+            self._progress_bar.update(progress=0)
+            self._last_progress = 0
 
-            if profile_exists():
-                existing = load_profile()
-                if not existing.is_empty():
-                    log.write(f"[#f59e0b]Existing profile found ({existing.completion_percentage():.0f}% complete)[/#f59e0b]\n[dim]Your responses will update the existing profile.[/dim]")
+            # Read the existing profile off the event loop so the progress bar paints right away
+            existing = await asyncio.to_thread(get_profile_cached)
+            if existing is not None and not existing.is_empty():
+                log.write(f"[#f59e0b]Existing profile found ({existing.completion_percentage():.0f}% complete)[/#f59e0b]\n[dim]Your responses will update the existing profile.[/dim]")
 
             initial = self.interviewer.get_initial_message()
             self._write_ai_message(log, initial)
@@ -333,7 +764,7 @@ class ChatScreen(Screen):
             return
 
         try:
-            from src.profile.interview import ProfileInterviewer
+            interviewer_class = _get_interviewer_class()
 
             # Check for --new flag
             start_new = args and "--new" in args
@@ -351,7 +782,8 @@ class ChatScreen(Screen):
                 return
 
             # Load from draft
-            self.interviewer = ProfileInterviewer(draft_path=str(INTERVIEW_DRAFT_PATH))
+            self.interviewer = interviewer_class(draft_path=str(INTERVIEW_DRAFT_PATH))
+            self._max_turns = getattr(self.interviewer, 'max_turns', 10)
             loaded = self.interviewer.load_draft()
 
             if not loaded:
@@ -361,8 +793,8 @@ class ChatScreen(Screen):
             self._in_interview = True
 
             # Show and reset progress bar
-            progress_bar = self.query_one("#interview-progress", ProgressBar)
-            progress_bar.add_class("visible")
+            self._progress_bar.add_class("visible")
+            self._last_progress = -1
             self._update_interview_progress()
 
             log.write("[#10b981]Resuming interview...[/#10b981]")
@@ -388,31 +820,26 @@ class ChatScreen(Screen):
             return
         # Each turn = 2 messages (user + assistant), max_turns default is 10
         turns = len(self.interviewer.conversation_history) // 2
-        max_turns = getattr(self.interviewer, 'max_turns', 10)
-        progress = min(100, int((turns / max_turns) * 100))
-        try:
-            progress_bar = self.query_one("#interview-progress", ProgressBar)
-            progress_bar.update(progress=progress)
-        except Exception:
-            pass
+        progress = min(100, int((turns / self._max_turns) * 100))
+        if progress == self._last_progress:
+            return
+        self._progress_bar.update(progress=progress)
+        self._last_progress = progress
 
     def _hide_interview_progress(self) -> None:
         """Hide the interview progress bar."""
-        try:
-            progress_bar = self.query_one("#interview-progress", ProgressBar)
-            progress_bar.remove_class("visible")
-        except Exception:
-            pass
+        self._progress_bar.remove_class("visible")
 
     async def _handle_interview_input(self, text: str, log: ChatLog) -> None:
         """Handle input during interview mode with streaming."""
         if text.lower() in ["/cancel", "/quit", "/exit"]:
+            self._pending_interview_input.clear()
             # Try to extract and save partial profile
             if self.interviewer:
                 try:
                     partial_profile = await self.interviewer.extract_partial_profile()
                     if partial_profile and not partial_profile.is_empty():
-                        save_profile(partial_profile)
+                        await asyncio.to_thread(save_profile, partial_profile)
                         log.write("")
                         log.write(f"[#10b981]Partial profile saved ({partial_profile.completion_percentage():.0f}% complete)[/#10b981]")
                 except Exception as e:
@@ -432,6 +859,15 @@ class ChatScreen(Screen):
             self._in_interview = False
             return
 
+        # A reply is still streaming: hold the answer and send it once that reply ends
+        if self._stream_bubble is not None:
+            self._pending_interview_input.append(text)
+            return
+
+        self._start_interview_stream(text, log)
+
+    def _start_interview_stream(self, text: str, log: ChatLog) -> None:
+        """Open a reply bubble and stream the interviewer's response to text."""
         # Start streaming response - create bubble and reset state
         self._stream_bubble = self._begin_ai_stream(log)
         self._stream_text = ""
@@ -454,15 +890,19 @@ class ChatScreen(Screen):
             profile = None
             display_enabled = True
             marker = "[PROFILE_COMPLETE]"
+            # Only text from here on can contain a marker not seen yet
+            scan_start = 0
             
             async for event_type, content in self.interviewer.process_response_streaming(user_message):
                 if event_type == "chunk" and isinstance(content, str):
-                    full_message += content
-
+                    # Past the marker nothing more is shown; the "done" event carries the full text
                     if not display_enabled:
                         continue
+                    full_message += content
 
-                    marker_index = full_message.find(marker)
+                    # Search only the new tail, backing up far enough to catch a marker split across chunks
+                    marker_index = full_message.find(marker, scan_start)
+                    scan_start = max(0, len(full_message) - len(marker) + 1)
                     if marker_index != -1:
                         display_enabled = False
                         # Post the clean text up to the marker
@@ -483,9 +923,19 @@ class ChatScreen(Screen):
             self.post_message(StreamError(error=str(e)))
 
     def on_stream_chunk(self, message: StreamChunk) -> None:
-        """Handle streaming chunk - update the bubble text."""
+        """Handle streaming chunk - buffer the text and schedule a bubble update."""
+        self._stream_text = message.text
+        # Coalesce bursts of chunks into one redraw per flush interval
+        if self._stream_bubble and self._stream_flush_timer is None:
+            self._stream_flush_timer = self.set_timer(STREAM_FLUSH_INTERVAL, self._flush_stream)
+
+    def _flush_stream(self) -> None:
+        """Push the latest buffered stream text to the bubble."""
+        if self._stream_flush_timer is not None:
+            self._stream_flush_timer.stop()
+            self._stream_flush_timer = None
         if self._stream_bubble:
-            self._stream_bubble.update(message.text)
+            self._stream_bubble.update(self._stream_text)
             # Scroll the bubble into view after refresh
             self.call_after_refresh(self._scroll_to_stream_bubble)
 
@@ -494,25 +944,25 @@ class ChatScreen(Screen):
         if self._stream_bubble:
             self._stream_bubble.scroll_visible(animate=False)
 
-    def on_stream_complete(self, message: StreamComplete) -> None:
+    async def on_stream_complete(self, message: StreamComplete) -> None:
         """Handle streaming completion - finalize UI and save profile."""
-        log = self.query_one("#chat-log", ChatLog)
+        # Show any text still waiting for the next flush
+        self._flush_stream()
+        log = self._chat_log
         
         # Update progress bar after each exchange
         self._update_interview_progress()
         
         if message.profile:
-            save_profile(message.profile)
+            # Leave interview mode before the write so input can't reach the old interviewer
             self._in_interview = False
+            await asyncio.to_thread(save_profile, message.profile)
             self.interviewer = None
             self._hide_interview_progress()
             
             # Set progress to 100% before hiding
-            try:
-                progress_bar = self.query_one("#interview-progress", ProgressBar)
-                progress_bar.update(progress=100)
-            except Exception:
-                pass
+            self._progress_bar.update(progress=100)
+            self._last_progress = 100
             
             log.write("[#10b981]Profile saved successfully![/#10b981]")
             
@@ -522,38 +972,56 @@ class ChatScreen(Screen):
             for key, value in summary.items():
                 if value is not None:
                     lines.append(f"      {key}: {value}")
-            log.write("\n".join(lines))
+            self._write_block(log, lines)
         
         # Clear stream state
         self._stream_bubble = None
         self._stream_text = ""
+        self._send_pending_interview_input(log)
 
     def on_stream_error(self, message: StreamError) -> None:
         """Handle streaming error."""
-        log = self.query_one("#chat-log", ChatLog)
+        self._flush_stream()
+        log = self._chat_log
         log.write(f"[#ef4444]Error: {message.error}[/#ef4444]\n[dim]Try again or type /cancel to exit interview[/dim]")
         
         # Clear stream state
         self._stream_bubble = None
         self._stream_text = ""
+        self._send_pending_interview_input(log)
 
-    async def _cmd_profile(self, log: ChatLog) -> None:
+    def _send_pending_interview_input(self, log: ChatLog) -> None:
+        """Send answers held back during the last reply as a single message."""
+        if not self._pending_interview_input:
+            return
+        text = "\n".join(self._pending_interview_input)
+        self._pending_interview_input.clear()
+        # Nothing to answer once the interview has finished or been cancelled
+        if self._in_interview and self.interviewer:
+            self._start_interview_stream(text, log)
+
+    async def _cmd_profile(self, log: ChatLog, args: list[str] | None = None) -> None:
         """Show current profile."""
-        if not profile_exists():
-            log.write("[#f59e0b]No profile found. Run /init to create one.[/f59e0b]")
+        profile = get_profile_cached()
+        if profile is None:
+            log.write("[#f59e0b]No profile found. Run /init to create one.[/#f59e0b]")
             return
 
-        profile = load_profile()
-        summary = profile.get_summary()
-        
-        lines = [f"[bold]Profile ({profile.completion_percentage():.0f}% complete)[/bold]"]
-        for key, value in summary.items():
-            if value is not None:
-                if isinstance(value, list):
-                    value = ", ".join(str(v) for v in value)
-                lines.append(f"  [#d4af37]{key}:[/#d4af37] {value}")
+        # Re-render only when the profile has been reloaded since the last /profile
+        cached_profile, text = self._profile_view_cache
+        if text is None or cached_profile is not profile:
+            summary = profile.get_summary()
+            
+            lines = [f"[bold]Profile ({profile.completion_percentage():.0f}% complete)[/bold]"]
+            for key, value in summary.items():
+                if value is not None:
+                    if isinstance(value, list):
+                        value = ", ".join(str(v) for v in value)
+                    lines.append(f"  [#d4af37]{key}:[/#d4af37] {value}")
+            text = "\n".join(lines)
+            self._profile_view_cache = (profile, text)
         
-        log.write("\n".join(lines))
+        log.write(text)
 
     async def _cmd_fetch(self, log: ChatLog, args: list[str]) -> None:
         """Fetch scholarships from sources."""
@@ -571,132 +1039,78 @@ class ChatScreen(Screen):
 
     async def _fetch_scholarships_worker(self) -> None:
         """Worker coroutine that fetches scholarships from all sources."""
-        from src.scrapers import (
-            FastwebScraper,
-            ScholarshipsComScraper,
-            CareerOneStopScraper,
-            IEFAScraper,
-            Scholars4devScraper,
-        )
-        from src.storage.database import get_session
-        from src.storage.models import Scholarship, FetchLog
-        from sqlalchemy import func
-        from datetime import datetime
+        # Scraper instances are kept between fetches so their HTTP connections are reused
+        if self._scraper_instances is None:
+            self._scraper_instances = [(name, scraper_class()) for name, scraper_class in _get_scrapers()]
+        scrapers = self._scraper_instances
+        try:
+            from dateutil import parser as dateparser
+        except ImportError:
+            dateparser = None
+
+        async def scrape(i: int, name: str, scraper: "BaseScraper") -> tuple[int, str, Optional[list[dict]], Optional[Exception]]:
+            """Run one scraper, returning its error instead of raising it."""
+            try:
+                return i, name, await scraper.scrape(), None
+            except Exception as e:
+                return i, name, None, e
         
-        scrapers = [
-            ("Fastweb", FastwebScraper),
-            ("Scholarships.com", ScholarshipsComScraper),
-            ("CareerOneStop", CareerOneStopScraper),
-            ("IEFA", IEFAScraper),
-            ("Scholars4dev", Scholars4devScraper),
-        ]
+        # One timestamp for the whole run, used for fetch logs and last_seen_at
+        now = datetime.now()
         
         try:
-            # Get count before
-            session = next(get_session())
-            before_count = session.query(func.count(Scholarship.id)).scalar() or 0
-            
-            for i, (name, scraper_class) in enumerate(scrapers):
+            # Scrapers are network-bound, so run them all at once and prepare each
+            # source's rows as soon as it finishes
+            tasks = []
+            for i, (name, scraper) in enumerate(scrapers):
                 self.post_message(FetchStartSource(index=i, name=name))
-                source_key = name.lower().replace(".", "_").replace(" ", "_")
-                count = 0
-                new_count = 0
-                
-                try:
-                    scraper = scraper_class()
-                    scholarships = await scraper.scrape()
-                    count = len(scholarships) if scholarships else 0
+                tasks.append(asyncio.create_task(scrape(i, name, scraper)))
+            
+            # (index, name, source key, scholarships found, insert rows by id)
+            prepared = []
+            # FetchLog rows, inserted together once the scholarships are saved
+            fetch_logs = []
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    i, name, scholarships, error = await next_done
+                    source_key = name.lower().replace(".", "_").replace(" ", "_")
+                    count = 0
                     
-                    # Save scholarships to database
-                    import hashlib
-                    for s in scholarships:
-                        # Generate unique ID from source + url or title
-                        id_base = f"{source_key}:{s.get('url') or s.get('title', '')}"
-                        scholarship_id = hashlib.sha256(id_base.encode()).hexdigest()[:64]
-                        
-                        # Parse amount (handle int, string like "$5,000", or range)
-                        amount = s.get("amount")
-                        if amount is None:
-                            amount = 0
-                        if isinstance(amount, str):
-                            amount = int("".join(c for c in amount if c.isdigit()) or "0")
-                        elif not isinstance(amount, (int, float)):
-                            amount = 0
-                        amount_cents = amount * 100 if amount < 10000 else amount  # Assume < 10000 is dollars
-                        
-                        # Parse deadline
-                        deadline_val = None
-                        if s.get("deadline"):
-                            try:
-                                from dateutil import parser as dateparser
-                                deadline_val = dateparser.parse(str(s["deadline"])).date()
-                            except Exception:
-                                pass
-                        
-                        # Convert requirements list to string
-                        raw_elig = s.get("requirements", [])
-                        if isinstance(raw_elig, list):
-                            raw_elig = "\n".join(str(r) for r in raw_elig)
+                    try:
+                        if error is not None:
+                            raise error
+                        count = len(scholarships) if scholarships else 0
                         
-                        # Check if exists
-                        existing = session.query(Scholarship).filter_by(id=scholarship_id).first()
-                        if existing:
-                            # Update last_seen_at
-                            existing.last_seen_at = datetime.now()
-                        else:
-                            # Insert new
-                            new_scholarship = Scholarship(
-                                id=scholarship_id,
-                                source=source_key,
-                                source_id=s.get("source_id"),
-                                title=s.get("title", "")[:500],
-                                description=s.get("description"),
-                                amount_min=amount_cents,
-                                amount_max=amount_cents,
-                                deadline=deadline_val,
-                                application_url=s.get("url"),
-                                raw_eligibility=raw_elig or None,
-                            )
-                            session.add(new_scholarship)
-                            new_count += 1
-                    
-                    session.commit()
-                    
-                    # Log fetch
-                    fetch_log = FetchLog(
-                        source=source_key,
-                        fetched_at=datetime.now(),
-                        scholarships_found=count,
-                        scholarships_new=new_count,
-                    )
-                    session.add(fetch_log)
-                    session.commit()
+                        # Hashing and date parsing are CPU work, so keep them off the event loop
+                        rows = await asyncio.to_thread(_prepare_rows, source_key, scholarships, dateparser)
+                    except Exception as e:
+                        logger.error(f"Fetch error for {name}: {e}")
+                        fetch_logs.append({
+                            "source": source_key,
+                            "fetched_at": now,
+                            "scholarships_found": count,
+                            "scholarships_new": 0,
+                            "errors": str(e),
+                        })
+                        self.post_message(FetchSourceError(index=i, name=name, error=str(e)))
+                        continue
                     
+                    prepared.append((i, name, source_key, count, rows))
                     self.post_message(FetchSourceComplete(index=i, name=name, count=count))
-                    
-                except Exception as e:
-                    logger.error(f"Fetch error for {name}: {e}")
-                    try:
-                        session.rollback()
-                        fetch_log = FetchLog(
-                            source=source_key,
-                            fetched_at=datetime.now(),
-                            scholarships_found=count,
-                            scholarships_new=new_count,
-                            errors=str(e),
-                        )
-                        session.add(fetch_log)
-                        session.commit()
-                    except Exception as log_error:
-                        logger.error(f"Failed to record fetch error for {name}: {log_error}")
-                    self.post_message(FetchSourceError(index=i, name=name, error=str(e)))
+            finally:
+                # Don't leave scrapers running if the worker is cancelled
+                for task in tasks:
+                    task.cancel()
             
-            # Get count after
-            session = next(get_session())
-            after_count = session.query(func.count(Scholarship.id)).scalar() or 0
-            new_count = after_count - before_count
+            # Save everything in one transaction, off the event loop, once scraping is done
+            total_new, after_count, failures = await asyncio.to_thread(
+                _save_fetch_results, prepared, fetch_logs, now
+            )
+            for i, name, error in failures:
+                self.post_message(FetchSourceError(index=i, name=name, error=error))
             
-            self.post_message(FetchComplete(total=after_count, new_count=new_count))
+            self._invalidate_data_cache()
+            self.post_message(FetchComplete(total=after_count, new_count=total_new))
             
         except Exception as e:
             logger.error(f"Fetch worker error: {e}")
@@ -725,11 +1139,8 @@ class ChatScreen(Screen):
             self.call_after_refresh(lambda: self._fetch_progress.scroll_visible() if self._fetch_progress else None)
         self._fetch_progress = None
 
-    async def _cmd_sources(self, log: ChatLog) -> None:
+    async def _cmd_sources(self, log: ChatLog, args: list[str] | None = None) -> None:
         """List available sources and their status."""
-        from src.storage.database import get_session
-        from src.storage.models import FetchLog
-        
         sources = [
             ("Fastweb", "fastweb"),
             ("Scholarships.com", "scholarships_com"),
@@ -740,15 +1151,24 @@ class ChatScreen(Screen):
         
         lines = ["[bold]Scholarship Sources[/bold]"]
         
-        session = next(get_session())
-        for name, key in sources:
-            last_fetch = (
-                session.query(FetchLog)
-                .filter_by(source=key)
-                .order_by(FetchLog.fetched_at.desc())
-                .first()
+        with session_scope() as session:
+            # Latest fetch of every source in one query: join each log to its source's newest time
+            latest = (
+                select(FetchLog.source, func.max(FetchLog.fetched_at).label("fetched_at"))
+                .group_by(FetchLog.source)
+                .subquery()
             )
-            
+            last_fetches = {
+                row.source: row
+                for row in session.execute(
+                    select(FetchLog.source, FetchLog.fetched_at, FetchLog.scholarships_found, FetchLog.errors)
+                    .join(latest, (FetchLog.source == latest.c.source) & (FetchLog.fetched_at == latest.c.fetched_at))
+                )
+            }
+
+        for name, key in sources:
+            last_fetch = last_fetches.get(key)
+
             if last_fetch:
                 if last_fetch.errors:
                     status = f"[red]Error: {last_fetch.errors[:30]}...[/red]"
@@ -756,65 +1176,36 @@ class ChatScreen(Screen):
                     status = f"[green]{last_fetch.fetched_at.strftime('%Y-%m-%d %H:%M')}[/green] ({last_fetch.scholarships_found} found)"
             else:
                 status = "[dim]Never fetched[/dim]"
-            
+
             lines.append(f"  {name}: {status}")
-            
-        log.write("\n".join(lines))
+
+        self._write_block(log, lines)
 
     async def _cmd_match(self, log: ChatLog, args: list[str]) -> None:
         """Find matching scholarships."""
-        if not profile_exists():
-            log.write("[yellow]No profile found. Run /init first.[/yellow]")
-            return
-
-        log.write("[yellow]Running matcher...[/yellow]")
-
         try:
-            from src.storage.database import get_session
-            from src.storage.models import Scholarship
-            from src.matching.matcher import EligibilityMatcher
-            from src.matching.scorer import FitScorer
+            # Profile and scholarships are read off the event loop
+            profile = await asyncio.to_thread(get_profile_cached)
+            if profile is None:
+                log.write("[yellow]No profile found. Run /init first.[/yellow]")
+                return
 
-            profile = load_profile()
-            session = next(get_session())
-            
-            # Load scholarships
-            db_scholarships = session.query(Scholarship).all()
-            if not db_scholarships:
+            log.write("[yellow]Running matcher...[/yellow]")
+
+            scholarships_data, total = await asyncio.to_thread(self._load_candidates, profile)
+            if not total:
                 log.write("[yellow]No scholarships in database. Run /fetch first.[/yellow]")
                 return
+            if not scholarships_data:
+                # Rows exist, but all were ruled out in SQL (expired or GPA too low)
+                log.write(f"[yellow]No eligible scholarships found out of {total} total.[/yellow]")
+                return
 
-            scholarships_data = []
-            for s in db_scholarships:
-                scholarships_data.append({
-                    "id": s.id,
-                    "title": s.title,
-                    "source": s.source,
-                    "description": s.description,
-                    "amount_min": s.amount_min,
-                    "amount_max": s.amount_max,
-                    "deadline": s.deadline.isoformat() if s.deadline else None,
-                    "application_url": s.application_url,
-                    "raw_eligibility": s.raw_eligibility,
-                    "parsed_eligibility": s.parsed_eligibility or {},
-                })
-
-            # Match
-            matcher = EligibilityMatcher()
-            match_results = matcher.match_batch(profile, scholarships_data)
-            
-            # Score
-            scorer = FitScorer()
-            fit_scores = scorer.score_batch(match_results, scholarships_data)
-            
-            # Combine and sort
-            for i, (s, match_res, fit) in enumerate(zip(scholarships_data, match_results, fit_scores)):
-                s["match_result"] = match_res.to_dict()
-                s["fit_score"] = fit.total
-
-            # Filter eligible and sort by score
-            eligible = [s for s in scholarships_data if s["match_result"]["eligible"]]
-            eligible.sort(key=lambda x: x["fit_score"], reverse=True)
+            # Match and score off the event loop
+            eligible_idx, eligible_matches, fit_scores = await asyncio.to_thread(
+                _match_and_score, self.matcher, self.scorer, profile, scholarships_data
+            )
+            totals = [fit.total for fit in fit_scores]
             
             # Parse limit from args
             limit = 10
@@ -827,75 +1218,151 @@ class ChatScreen(Screen):
                 elif arg.isdigit():
                     limit = int(arg)
 
-            lines = [f"[green]Found {len(eligible)} eligible matches out of {len(scholarships_data)} total[/green]", ""]
-            lines.append("[dim]Click links to open in browser[/dim]")
-            lines.append("")
-            
-            from rich.markup import escape as markup_escape
+            # Pick the top `limit` positions from the parallel score list
+            top_pos = heapq.nlargest(limit, range(len(totals)), key=totals.__getitem__)
+            top_matches = [
+                (scholarships_data[eligible_idx[pos]], eligible_matches[pos], totals[pos])
+                for pos in top_pos
+            ]
+
+            # Render straight into one buffer rather than a list of lines to join
+            buf = io.StringIO()
+            write = buf.write
+            write(f"[green]Found {len(eligible_idx)} eligible matches out of {total} total[/green]\n\n")
+            write("[dim]Click links to open in browser[/dim]\n")
+
+            # Bind the row templates once instead of rebuilding f-strings per match
+            title_link = "[bold][link=\"{0}\"]{1}. {2}[/link][/bold]".format
+            title_plain = "[bold]{0}. {1}[/bold]".format
+            score_line = "   [{0}]{1}% fit[/{0}] | Match: {2}% | {3} | Deadline: {4}".format
+            source_plain = "   [dim]{0}[/dim]".format
+            source_link = "   [dim]{0}[/dim] • [link=\"{1}\"][cyan]{2}[/cyan][/link]".format
                     
             # Display top matches
-            for i, s in enumerate(eligible[:limit], 1):
-                score_pct = int(s["fit_score"] * 100)
-                # Safely get match percentage
-                match_res = s.get("match_result", {})
-                match_pct = int(match_res.get("match_percentage", 0))
+            for i, (s, match_res, fit_score) in enumerate(top_matches, 1):
+                score_pct = int(fit_score * 100)
+                match_pct = int(match_res.match_percentage)
                 
-                if score_pct >= 80:
-                    score_style = "#10b981"  # Emerald
-                elif score_pct >= 60:
-                    score_style = "#f59e0b"  # Amber
-                else:
-                    score_style = "#ef4444"  # Ruby Red
+                score_style = _FIT_STYLES[bisect.bisect_right(_FIT_THRESHOLDS, score_pct)]
                 
-                amount = self._format_amount(s.get("amount_min"), s.get("amount_max"))
-                deadline = s.get("deadline", "Open")[:10] if s.get("deadline") else "Open"
-                url = s.get("application_url", "")
-                title = markup_escape(s['title'][:50])
-                safe_url = ""
-                if url:
-                    safe_url = (
-                        url.replace("\"", "%22")
-                        .replace("[", "%5B")
-                        .replace("]", "%5D")
-                    )
+                title, amount, deadline, safe_url, display_url = _render_row(
+                    s.id, s.title, s.amount_min, s.amount_max, s.deadline, s.application_url
+                )
+                source = s.source or "Unknown"
                 
-                # Title line - make it a clickable link if URL exists
-                if url:
-                    lines.append(f"[bold][link=\"{safe_url}\"]{i}. {title}[/link][/bold]")
+                # Title line is a clickable link if URL exists, followed by the source and URL
+                if safe_url:
+                    title_line = title_link(safe_url, i, title)
+                    source_line = source_link(source, safe_url, display_url)
                 else:
-                    lines.append(f"[bold]{i}. {title}[/bold]")
-                
-                lines.append(f"   [{score_style}]{score_pct}% fit[/{score_style}] | Match: {match_pct}% | {amount} | Deadline: {deadline}")
+                    title_line = title_plain(i, title)
+                    source_line = source_plain(source)
                 
-                # Source and URL line
-                source_line = f"   [dim]{s.get('source', 'Unknown')}[/dim]"
-                if url:
-                    # Truncate long URLs for display, escape for markup
-                    display_url = url if len(url) <= 50 else url[:47] + "..."
-                    display_url_escaped = markup_escape(display_url)
-                    source_line += f" • [link=\"{safe_url}\"][cyan]{display_url_escaped}[/cyan][/link]"
-                lines.append(source_line)
+                if buf.tell():
+                    write("\n")
+                write(title_line)
+                write("\n")
+                write(score_line(score_style, score_pct, match_pct, amount, deadline))
+                write("\n")
+                write(source_line)
+
+                # Show long result lists in chunks so the first rows appear right away
+                if i % MATCH_RENDER_CHUNK == 0 and i < len(top_matches):
+                    log.write(buf.getvalue())
+                    buf = io.StringIO()
+                    write = buf.write
+                    await asyncio.sleep(0)
             
-            if len(eligible) > limit:
-                lines.append(f"[dim]...and {len(eligible) - limit} more. Use /match --limit=N to see more.[/dim]")
+            if len(eligible_idx) > limit:
+                write(f"\n[dim]...and {len(eligible_idx) - limit} more. Use /match --limit=N to see more.[/dim]")
 
-            log.write("\n".join(lines))
+            log.write(buf.getvalue())
 
         except Exception as e:
             log.write(f"[#ef4444]Matching failed: {e}[/#ef4444]")
 
 
+    def _load_candidates(self, profile: "UserProfile") -> tuple[list[ScholarshipRow], int]:
+        """Load the profile's candidate scholarships in a session of its own.
+
+        Blocking database I/O, so commands run it in a worker thread.
+
+        Returns:
+            Tuple of (candidate rows, scholarships in the table).
+        """
+        with session_scope() as session:
+            return self._load_scholarships_data(session, profile)
+
+    def _load_scholarships_data(self, session, profile: "UserProfile") -> tuple[list[ScholarshipRow], int]:
+        """Load scholarships as matcher input, reusing the last load if unchanged.
+
+        Scholarships the profile can be ruled out for in SQL (expired, GPA too low)
+        are not loaded, so the table's full row count is returned alongside them.
+
+        Returns:
+            Tuple of (candidate rows, scholarships in the table).
+        """
+        today = date.today()
+        gpa = profile.academic.gpa
+        total, last_updated = session.query(func.count(Scholarship.id), func.max(Scholarship.updated_at)).one()
+        fingerprint = (today, gpa, total, last_updated)
+        cached_fingerprint, cached_data = self._data_cache
+        if cached_data is not None and cached_fingerprint == fingerprint:
+            return cached_data, total
+
+        # Expired scholarships can never be applied to, so leave them in the database
+        filters = [or_(Scholarship.deadline.is_(None), Scholarship.deadline >= today)]
+
+        # A numeric min_gpa above the profile's GPA is a hard failure in the matcher
+        if gpa is not None:
+            min_gpa_type = func.coalesce(func.json_type(Scholarship.parsed_eligibility, "$.min_gpa"), "null")
+            min_gpa = func.json_extract(Scholarship.parsed_eligibility, "$.min_gpa")
+            filters.append(or_(min_gpa_type.not_in(("integer", "real")), min_gpa <= gpa))
+
+        # Select only the columns ScholarshipRow needs, skipping the large text columns
+        stmt = select(
+            Scholarship.id,
+            Scholarship.title,
+            Scholarship.source,
+            Scholarship.amount_min,
+            Scholarship.amount_max,
+            Scholarship.deadline,
+            Scholarship.application_url,
+            Scholarship.parsed_eligibility,
+            Scholarship.effort_score,
+            Scholarship.competition_score,
+        ).where(*filters)
+
+        scholarships_data = [
+            ScholarshipRow(
+                id=id_,
+                title=title,
+                source=source,
+                amount_min=amount_min,
+                amount_max=amount_max,
+                deadline=deadline,
+                application_url=application_url,
+                parsed_eligibility=parsed_eligibility or {},
+                effort_score=effort_score,
+                competition_score=competition_score,
+            )
+            for (
+                id_, title, source, amount_min, amount_max, deadline,
+                application_url, parsed_eligibility, effort_score, competition_score,
+            ) in session.execute(stmt)
+        ]
+
+        self._data_cache = (fingerprint, scholarships_data)
+        return scholarships_data, total
+
+    def _invalidate_data_cache(self) -> None:
+        """Drop cached scholarship data after the table is modified."""
+        self._data_cache = (None, None)
+        _render_row.cache_clear()
+
     def _format_amount(self, amount_min: Optional[int], amount_max: Optional[int]) -> str:
         """Format amount for display."""
-        if amount_max:
-            dollars = amount_max // 100
-            if dollars >= 10000:
-                return f"${dollars // 1000}k"
-            return f"${dollars:,}"
-        elif amount_min:
-            dollars = amount_min // 100
-            return f"${dollars:,}+"
-        return "Varies"
+        return _format_amount(amount_min, amount_max)
 
     async def _cmd_info(self, log: ChatLog, args: list[str]) -> None:
         """Show detailed info for a scholarship."""
@@ -906,59 +1373,61 @@ class ChatScreen(Screen):
         scholarship_id = args[0]
         
         try:
-            from src.storage.database import get_session
-            from src.storage.models import Scholarship
-            
-            session = next(get_session())
-            scholarship = session.query(Scholarship).filter_by(id=scholarship_id).first()
-            
-            if not scholarship:
-                log.write(f"[#ef4444]Scholarship not found: {scholarship_id}[/#ef4444]")
-                return
+            with session_scope() as session:
+                scholarship = session.get(Scholarship, scholarship_id)
 
-            lines = []
-            lines.append(f"[bold]{scholarship.title}[/bold]")
-            lines.append(f"[dim]Source: {scholarship.source}[/dim]")
-            lines.append("")
-            
-            amount = self._format_amount(scholarship.amount_min, scholarship.amount_max)
-            lines.append(f"[#d4af37]Amount:[/#d4af37] {amount}")
-            
-            if scholarship.deadline:
-                lines.append(f"[#d4af37]Deadline:[/#d4af37] {scholarship.deadline.strftime('%Y-%m-%d')}")
-            else:
-                lines.append("[#d4af37]Deadline:[/#d4af37] Open/Rolling")
-            
-            if scholarship.description:
-                lines.append("")
-                lines.append("[#d4af37]Description:[/#d4af37]")
-                # Truncate long descriptions
-                desc = scholarship.description[:500]
-                for line in desc.split("\n"):
-                    lines.append(f"  {line}")
-                if len(scholarship.description) > 500:
-                    lines.append("  ...")
-            
-            if scholarship.application_url:
+                if not scholarship:
+                    log.write(f"[#ef4444]Scholarship not found: {scholarship_id}[/#ef4444]")
+                    return
+
+                lines = []
+                lines.append(f"[bold]{scholarship.title}[/bold]")
+                lines.append(f"[dim]Source: {scholarship.source}[/dim]")
                 lines.append("")
-                lines.append(f"[#d4af37]Apply:[/#d4af37] {scholarship.application_url}")
 
-            log.write("\n".join(lines))
+                amount = self._format_amount(scholarship.amount_min, scholarship.amount_max)
+                lines.append(f"[#d4af37]Amount:[/#d4af37] {amount}")
+
+                if scholarship.deadline:
+                    lines.append(f"[#d4af37]Deadline:[/#d4af37] {scholarship.deadline.strftime('%Y-%m-%d')}")
+                else:
+                    lines.append("[#d4af37]Deadline:[/#d4af37] Open/Rolling")
+
+                description = scholarship.description
+                if description:
+                    lines.append("")
+                    lines.append("[#d4af37]Description:[/#d4af37]")
+                    # Truncate long descriptions
+                    truncated = len(description) > 500
+                    body = description[:500] if truncated else description
+                    lines.extend(f"  {line}" for line in body.splitlines())
+                    if truncated:
+                        lines.append("  ...")
+
+                if scholarship.application_url:
+                    lines.append("")
+                    lines.append(f"[#d4af37]Apply:[/#d4af37] {scholarship.application_url}")
+
+            self._write_block(log, lines)
 
         except Exception as e:
             log.write(f"[#ef4444]Error: {e}[/#ef4444]")
 
     async def _cmd_save(self, log: ChatLog, args: list[str]) -> None:
         """Save matches to file."""
-        if not profile_exists():
-            log.write("[#f59e0b]No profile found. Run /init and /match first.[/f59e0b]")
+        try:
+            profile = await asyncio.to_thread(get_profile_cached)
+        except Exception as e:
+            log.write(f"[#ef4444]Save failed: {e}[/#ef4444]")
+            return
+        if profile is None:
+            log.write("[#f59e0b]No profile found. Run /init and /match first.[/#f59e0b]")
             return
 
         # Default to data/matches.csv
         if args:
             filename = args[0]
             # If just a filename without path, put it in data/
-            from pathlib import Path
             filepath = Path(filename)
             if not filepath.parent.name:  # No directory specified
                 ensure_data_dir()
@@ -980,117 +1449,51 @@ class ChatScreen(Screen):
         log.write(f"[#f59e0b]Saving matches to {filename}...[/#f59e0b]")
 
         try:
-            from src.storage.database import get_session
-            from src.storage.models import Scholarship
-            from src.matching.matcher import EligibilityMatcher
-            from src.matching.scorer import FitScorer
-            import json
-            import csv
-
-            profile = load_profile()
-            session = next(get_session())
-            db_scholarships = session.query(Scholarship).all()
-
-            if not db_scholarships:
-                log.write("[#f59e0b]No scholarships to save. Run /fetch first.[/f59e0b]")
+            scholarships_data, total = await asyncio.to_thread(self._load_candidates, profile)
+
+            if not total:
+                log.write("[#f59e0b]No scholarships to save. Run /fetch first.[/#f59e0b]")
                 return
 
-            # Run matching
-            scholarships_data = []
-            for s in db_scholarships:
-                scholarships_data.append({
+            # Run matching and scoring off the event loop; only eligible scholarships are saved
+            eligible_idx, _, fit_scores = await asyncio.to_thread(
+                _match_and_score, self.matcher, self.scorer, profile, scholarships_data
+            )
+
+            eligible = []
+            for i, fit in zip(eligible_idx, fit_scores):
+                s = scholarships_data[i]
+                eligible.append({
                     "id": s.id,
                     "title": s.title,
                     "source": s.source,
                     "amount_min": s.amount_min,
                     "amount_max": s.amount_max,
-                    "deadline": s.deadline.isoformat() if s.deadline else None,
+                    "deadline": s.deadline,
                     "application_url": s.application_url,
+                    "eligible": True,
+                    "fit_score": fit.total,
                 })
 
-            matcher = EligibilityMatcher()
-            match_results = matcher.match_batch(profile, scholarships_data)
-            
-            scorer = FitScorer()
-            fit_scores = scorer.score_batch(match_results, scholarships_data)
-
-            for i, (s, match_res, fit) in enumerate(zip(scholarships_data, match_results, fit_scores)):
-                s["eligible"] = match_res.eligible
-                s["fit_score"] = fit.total
-
-            # Filter and sort
-            eligible = [s for s in scholarships_data if s["eligible"]]
-            eligible.sort(key=lambda x: x["fit_score"], reverse=True)
-
-            # Save based on format
-            if fmt == "json":
-                with open(filename, "w") as f:
-                    json.dump(eligible, f, indent=2, default=str)
-            elif fmt == "csv":
-                with open(filename, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=["title", "fit_score", "amount", "deadline", "source", "application_url"])
-                    writer.writeheader()
-                    for s in eligible:
-                        # Format amount
-                        amount = ""
-                        if s.get("amount_max"):
-                            dollars = s["amount_max"] // 100
-                            amount = f"${dollars:,}"
-                        elif s.get("amount_min"):
-                            dollars = s["amount_min"] // 100
-                            amount = f"${dollars:,}+"
-                        
-                        writer.writerow({
-                            "title": s["title"],
-                            "fit_score": f"{int(s['fit_score'] * 100)}%",
-                            "amount": amount or "Varies",
-                            "deadline": s["deadline"] or "Open",
-                            "source": s["source"],
-                            "application_url": s["application_url"] or "",
-                        })
-            elif fmt == "markdown":
-                with open(filename, "w") as f:
-                    f.write("# Scholarship Matches\n\n")
-                    for i, s in enumerate(eligible, 1):
-                        f.write(f"## {i}. {s['title']}\n\n")
-                        f.write(f"- **Fit Score:** {int(s['fit_score'] * 100)}%\n")
-                        f.write(f"- **Source:** {s['source']}\n")
-                        f.write(f"- **Deadline:** {s['deadline'] or 'Open'}\n")
-                        if s["application_url"]:
-                            f.write(f"- **Apply:** {s['application_url']}\n")
-                        f.write("\n")
+            # Sort
+            eligible.sort(key=itemgetter("fit_score"), reverse=True)
+
+            # Write the file off the event loop
+            await asyncio.to_thread(_write_matches, filename, fmt, eligible)
 
             log.write(f"[#10b981]Saved {len(eligible)} matches to {filename}[/#10b981]")
 
         except Exception as e:
             log.write(f"[#ef4444]Save failed: {e}[/#ef4444]")
 
-    async def _cmd_stats(self, log: ChatLog) -> None:
+    async def _cmd_stats(self, log: ChatLog, args: list[str] | None = None) -> None:
         """Show database statistics."""
         try:
-            from src.storage.database import get_session
-            from src.storage.models import Scholarship, FetchLog
-            from sqlalchemy import func
-            from datetime import datetime, timedelta
-
-            session = next(get_session())
-            
-            total = session.query(func.count(Scholarship.id)).scalar() or 0
-            
-            # Count by source
-            by_source = (
-                session.query(Scholarship.source, func.count(Scholarship.id))
-                .group_by(Scholarship.source)
-                .all()
-            )
-            
-            # Recent (last 24h)
-            yesterday = datetime.now() - timedelta(days=1)
-            recent_fetches = (
-                session.query(FetchLog)
-                .filter(FetchLog.fetched_at > yesterday)
-                .count()
-            )
+            # Database round-trips run in a worker thread so the UI stays responsive
+            stats = await asyncio.to_thread(_collect_stats)
+            by_source = stats["by_source"]
+            total = stats["total"]
+            recent_fetches = stats["recent"]
 
             lines = ["[bold #d4af37]Database Statistics[/bold #d4af37]"]
             lines.append(f"  Total scholarships: {total}")
@@ -1100,31 +1503,21 @@ class ChatScreen(Screen):
             for source, count in by_source:
                 lines.append(f"  [#a0a0a0]{source}:[/#a0a0a0] {count}")
             
-            log.write("\n".join(lines))
+            self._write_block(log, lines)
 
         except Exception as e:
             log.write(f"[#ef4444]Error: {e}[/#ef4444]")
 
-    async def _cmd_clean(self, log: ChatLog) -> None:
+    async def _cmd_clean(self, log: ChatLog, args: list[str] | None = None) -> None:
         """Remove expired scholarships."""
         try:
-            from src.storage.database import get_session
-            from src.storage.models import Scholarship
-            from datetime import date
-
-            session = next(get_session())
-            
-            today = date.today()
-            expired = session.query(Scholarship).filter(Scholarship.deadline < today).all()
-            count = len(expired)
+            count = await asyncio.to_thread(_delete_expired)
             
             if count == 0:
                 log.write("[#10b981]No expired scholarships to remove.[/#10b981]")
                 return
 
-            for s in expired:
-                session.delete(s)
-            session.commit()
+            self._invalidate_data_cache()
             
             log.write(f"[#10b981]Removed {count} expired scholarships.[/#10b981]")
 
@@ -1134,39 +1527,81 @@ class ChatScreen(Screen):
     async def _cmd_apikey(self, log: ChatLog, args: list[str]) -> None:
         """Set OpenAI API key."""
         if not args:
-            current = os.getenv("OPENAI_API_KEY")
+            if self._api_key is _UNSET:
+                self._api_key = os.getenv("OPENAI_API_KEY")
+            current = self._api_key
             if current:
                 masked = current[:8] + "..." + current[-4:]
                 log.write(f"[#10b981]API key is set: {masked}[/#10b981]")
             else:
-                log.write("[#f59e0b]No API key set. Use /apikey <key> to set one.[/f59e0b]")
+                log.write("[#f59e0b]No API key set. Use /apikey <key> to set one.[/#f59e0b]")
             return
 
         key = args[0]
         os.environ["OPENAI_API_KEY"] = key
+        self._api_key = key
         
         # Also try to save to .env file
         try:
-            env_path = ".env"
-            lines = []
-            key_found = False
-            
-            if os.path.exists(env_path):
-                with open(env_path, "r") as f:
-                    for line in f:
-                        if line.startswith("OPENAI_API_KEY="):
-                            lines.append(f"OPENAI_API_KEY={key}\n")
-                            key_found = True
-                        else:
-                            lines.append(line)
+            # Follow a symlinked .env so the link is kept and its target updated
+            env_path = Path(".env").resolve()
+            entry = f"OPENAI_API_KEY={key}\n".encode()
+            try:
+                data = env_path.read_bytes()
+                mode = env_path.stat().st_mode & 0o777
+            except FileNotFoundError:
+                # The file holds a secret, so a new one is private to the user
+                data = b""
+                mode = 0o600
             
-            if not key_found:
-                lines.append(f"OPENAI_API_KEY={key}\n")
+            # Replace the first entry in place and drop any duplicates, which
+            # python-dotenv would otherwise let override it; append one if missing
+            replaced = 0
+
+            def replace_entry(_match: re.Match) -> bytes:
+                nonlocal replaced
+                replaced += 1
+                return entry if replaced == 1 else b""
+
+            data = _ENV_API_KEY_RE.sub(replace_entry, data)
+            if not replaced:
+                if data and not data.endswith(b"\n"):
+                    data += b"\n"
+                data += entry
             
-            with open(env_path, "w") as f:
-                f.writelines(lines)
+            # Write a temp file with the same permissions and swap it in, so a crash
+            # can't leave .env half-written and the key is never world-readable
+            tmp_path = env_path.with_name(env_path.name + ".tmp")
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, mode)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                # os.open's mode is narrowed by the umask; match the original exactly
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, env_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
             log.write("[#10b981]API key set and saved to .env[/#10b981]")
         except Exception:
-            log.write("[#10b981]API key set for this session.[/ #10b981]")
+            log.write("[#10b981]API key set for this session.[/#10b981]")
             log.write("[dim]Could not save to .env file[/dim]")
+
+    # Command dispatch table; every handler takes (self, log, args)
+    _COMMAND_HANDLERS = {
+        CommandType.HELP: _cmd_help,
+        CommandType.QUIT: _cmd_quit,
+        CommandType.INIT: _cmd_init,
+        CommandType.RESUME: _cmd_resume,
+        CommandType.PROFILE: _cmd_profile,
+        CommandType.FETCH: _cmd_fetch,
+        CommandType.SOURCES: _cmd_sources,
+        CommandType.MATCH: _cmd_match,
+        CommandType.INFO: _cmd_info,
+        CommandType.SAVE: _cmd_save,
+        CommandType.STATS: _cmd_stats,
+        CommandType.CLEAN: _cmd_clean,
+        CommandType.APIKEY: _cmd_apikey,
+    }